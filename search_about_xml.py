@@ -11,6 +11,7 @@ Usage:
     python search_about_xml.py --author "user"
     python search_about_xml.py --description "combat"
     python search_about_xml.py --list-all
+    python search_about_xml.py --modlist ModsConfig.xml --name "battle"
 """
 
 import os
@@ -18,7 +19,7 @@ import sys
 import argparse
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
 # Default workshop content path for RimWorld
@@ -163,9 +164,105 @@ def find_about_xml_files(workshop_path: str) -> List[str]:
     print(f"Found {len(about_files)} About.xml files")
     return about_files
 
-def parse_all_mods(workshop_path: str) -> List[ModInfo]:
-    """Parse all About.xml files and return ModInfo objects"""
+def read_package_id(about_xml_path: str) -> str:
+    """Read only the mod's own top-level packageId from an About.xml, stopping as soon as it is found"""
+    try:
+        with open(about_xml_path, 'rb') as f:
+            depth = 0
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                # Skip nested packageIds such as those inside <modDependencies>
+                if depth == 1 and elem.tag == 'packageId':
+                    return (elem.text or "").strip()
+                # Drop finished elements so long descriptions are not kept in memory
+                elem.clear()
+    except ET.ParseError as e:
+        print(f"Warning: Failed to parse {about_xml_path}: {e}")
+    except Exception as e:
+        print(f"Warning: Error processing {about_xml_path}: {e}")
+    return ""
+
+def build_package_id_index(about_files: List[Tuple[str, str]]) -> Dict[str, Tuple[str, str]]:
+    """Map lowercased package IDs to their (mod folder, About.xml) pair"""
+    index = {}
+    # Sort so the folder chosen for a duplicate package ID does not depend on filesystem order
+    for mod_path, about_xml_path in sorted(about_files):
+        package_id = read_package_id(about_xml_path).lower()
+        if not package_id:
+            continue
+        if package_id in index:
+            print(f"Warning: Duplicate package ID '{package_id}' in {mod_path}, "
+                  f"using {index[package_id][0]}")
+            continue
+        index[package_id] = (mod_path, about_xml_path)
+    return index
+
+def read_mod_list(modlist_path: str) -> List[str]:
+    """Read package IDs in load order from ModsConfig.xml, a saved/exported mod list or a plain text list"""
+    try:
+        with open(modlist_path, 'r', encoding='utf-8-sig') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: Could not read mod list {modlist_path}: {e}")
+        sys.exit(1)
+    
+    if modlist_path.lower().endswith('.txt') or not content.lstrip().startswith('<'):
+        # Plain text list, one package ID per line
+        package_ids = [line.strip().lower() for line in content.splitlines()
+                       if line.strip() and not line.strip().startswith('#')]
+        print(f"Read {len(package_ids)} package IDs from mod list: {modlist_path}")
+        return package_ids
+    
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        print(f"Error: Could not parse mod list {modlist_path}: {e}")
+        sys.exit(1)
+    
+    # ModsConfig.xml and RimSort exports use <activeMods>, saved .rml lists use <modList><ids>
+    ids_elem = root.find('activeMods')
+    if ids_elem is None:
+        ids_elem = root.find('modList/ids')
+    if ids_elem is None:
+        print(f"Error: No <activeMods> or <modList><ids> found in mod list {modlist_path}")
+        sys.exit(1)
+    
+    package_ids = [li.text.strip().lower() for li in ids_elem.findall('li') if li.text and li.text.strip()]
+    print(f"Read {len(package_ids)} package IDs from mod list: {modlist_path}")
+    return package_ids
+
+def filter_by_mod_list(about_files: List[Tuple[str, str]], package_ids: List[str]) -> List[Tuple[str, str]]:
+    """Restrict About.xml files to the mods in a mod list, returned in load order"""
+    index = build_package_id_index(about_files)
+    selected = []
+    seen = set()
+    missing = []
+    for package_id in package_ids:
+        entry = index.get(package_id)
+        if entry is None and package_id.endswith('_steam'):
+            # RimWorld suffixes workshop copies of mods that also exist locally
+            entry = index.get(package_id[:-len('_steam')])
+        if entry is None:
+            missing.append(package_id)
+        elif entry not in seen:
+            seen.add(entry)
+            selected.append(entry)
+    
+    print(f"Matched {len(selected)} mods from mod list")
+    if missing:
+        print(f"{len(missing)} mods not found in workshop path (core, DLC or local mods): {', '.join(missing)}")
+    return selected
+
+def parse_all_mods(workshop_path: str, modlist_path: Optional[str] = None) -> List[ModInfo]:
+    """Parse all About.xml files and return ModInfo objects, optionally limited to a mod list"""
+    # Read the mod list first so a bad path fails before the workshop is scanned
+    package_ids = read_mod_list(modlist_path) if modlist_path else None
     about_files = find_about_xml_files(workshop_path)
+    if package_ids is not None:
+        about_files = filter_by_mod_list(about_files, package_ids)
     mods = []
     
     for mod_path, about_xml_path in about_files:
@@ -194,6 +291,7 @@ Examples:
   python search_about_xml.py --package-id "user.battlestations"
   python search_about_xml.py --dependencies "core"
   python search_about_xml.py --search "weapon" --field all
+  python search_about_xml.py --modlist ModsConfig.xml --list-all
         """
     )
     
@@ -203,6 +301,11 @@ Examples:
         help=f"Path to workshop content directory (default: {DEFAULT_WORKSHOP_PATH})"
     )
     
+    parser.add_argument(
+        "--modlist",
+        help="Only include mods from a ModsConfig.xml, saved/RimSort mod list or text file of package IDs"
+    )
+    
     parser.add_argument(
         "--list-all",
         action="store_true",
@@ -256,7 +359,7 @@ Examples:
     
     # Parse all mods
     print("Loading mod information...")
-    mods = parse_all_mods(args.workshop_path)
+    mods = parse_all_mods(args.workshop_path, args.modlist)
     
     if not mods:
         print("No mods found!")
@@ -12,16 +12,26 @@ from pathlib import Path
 import re
 from collections import defaultdict
 
+from search_about_xml import find_about_xml_files, read_mod_list, filter_by_mod_list
+
 class ModContentSearcher:
     def __init__(self, workshop_path):
         self.workshop_path = Path(workshop_path)
         self.mods = []
         
-    def load_mods(self):
-        """Load all mod directories and their About.xml files"""
+    def load_mods(self, modlist_path=None):
+        """Load all mod directories and their About.xml files, optionally limited to a mod list"""
         print("Loading mod information...")
-        about_files = list(self.workshop_path.rglob("About/About.xml"))
-        print(f"Found {len(about_files)} About.xml files")
+        # Read the mod list first so a bad path fails before the workshop is scanned
+        package_ids = read_mod_list(modlist_path) if modlist_path else None
+        
+        if package_ids is not None:
+            # Only look at top-level mod folders instead of walking every file in the workshop
+            about_files = find_about_xml_files(str(self.workshop_path))
+            about_files = [Path(about_xml_path) for _, about_xml_path in filter_by_mod_list(about_files, package_ids)]
+        else:
+            about_files = list(self.workshop_path.rglob("About/About.xml"))
+            print(f"Found {len(about_files)} About.xml files")
         
         for about_file in about_files:
             try:
@@ -314,6 +324,11 @@ def main():
         help="Type of content to search"
     )
     
+    parser.add_argument(
+        '--modlist',
+        help="Only search mods from a ModsConfig.xml, saved/RimSort mod list or text file of package IDs"
+    )
+    
     parser.add_argument(
         '--count',
         action='store_true',
@@ -327,7 +342,7 @@ def main():
         sys.exit(1)
         
     searcher = ModContentSearcher(args.workshop_path)
-    searcher.load_mods()
+    searcher.load_mods(args.modlist)
     
     results = searcher.search_all_content(args.search_term, args.type)
     